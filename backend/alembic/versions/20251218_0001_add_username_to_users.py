@@ -24,11 +24,19 @@ depends_on = None
 
 
 def upgrade() -> None:
+    # Reflect everything this migration needs once, up front; each inspector call is a
+    # catalog round-trip on remote databases.
     bind = op.get_bind()
     inspector = sa.inspect(bind)
     existing_tables = set(inspector.get_table_names())
-
-    if "users" not in existing_tables:
+    has_users = "users" in existing_tables
+    existing_users_columns: set[str] = set()
+    existing_users_indexes: set[str] = set()
+    if has_users:
+        existing_users_columns = {col["name"] for col in inspector.get_columns("users")}
+        existing_users_indexes = {idx["name"] for idx in inspector.get_indexes("users")}
+
+    if not has_users:
         op.create_table(
             "users",
             sa.Column("id", sa.String(length=36), primary_key=True, nullable=False),
@@ -59,12 +67,10 @@ def upgrade() -> None:
         op.create_index("ix_users_email_verification_token_hash", "users", ["email_verification_token_hash"], unique=False)
         op.create_index("ix_users_password_reset_token_hash", "users", ["password_reset_token_hash"], unique=False)
     else:
-        existing_columns = {col["name"] for col in inspector.get_columns("users")}
-        if "username" not in existing_columns:
+        if "username" not in existing_users_columns:
             op.add_column("users", sa.Column("username", sa.String(length=30), nullable=True))
 
-        existing_indexes = {idx["name"] for idx in inspector.get_indexes("users")}
-        if "ix_users_username" not in existing_indexes:
+        if "ix_users_username" not in existing_users_indexes:
             op.create_index("ix_users_username", "users", ["username"], unique=True)
 
     if "orientations" not in existing_tables:
@@ -0,0 +1,48 @@
+"""composite (user_id, created_at DESC) indexes for per-user list queries
+
+Revision ID: 20261014_0002
+Revises: 20251218_0001
+Create Date: 2026-10-14
+
+`GET /orientations/me` and `GET /results/me` filter on user_id and order by
+created_at DESC. A composite descending index returns rows already sorted, so
+the single-column user_id indexes become redundant and are dropped.
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261014_0002"
+down_revision = "20251218_0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_orientations_user_created",
+        "orientations",
+        ["user_id", sa.text("created_at DESC")],
+        unique=False,
+    )
+    op.drop_index("ix_orientations_user_id", table_name="orientations")
+
+    op.create_index(
+        "ix_results_user_created",
+        "results",
+        ["user_id", sa.text("created_at DESC")],
+        unique=False,
+    )
+    op.drop_index("ix_results_user_id", table_name="results")
+
+
+def downgrade() -> None:
+    op.create_index("ix_results_user_id", "results", ["user_id"], unique=False)
+    op.drop_index("ix_results_user_created", table_name="results")
+
+    op.create_index("ix_orientations_user_id", "orientations", ["user_id"], unique=False)
+    op.drop_index("ix_orientations_user_created", table_name="orientations")
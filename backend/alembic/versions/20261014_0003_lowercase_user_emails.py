@@ -0,0 +1,34 @@
+"""store users.email lowercase
+
+Revision ID: 20261014_0003
+Revises: 20261014_0002
+Create Date: 2026-10-14
+
+Request schemas now lowercase emails at parse time. Normalize any legacy rows and
+enforce the invariant with a CHECK constraint so lookups can compare `email`
+directly (no LOWER() in SQL).
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261014_0003"
+down_revision = "20261014_0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("UPDATE users SET email = lower(email) WHERE email <> lower(email)")
+
+    # batch mode: SQLite cannot ALTER TABLE ... ADD CONSTRAINT.
+    with op.batch_alter_table("users") as batch_op:
+        batch_op.create_check_constraint("ck_users_email_lowercase", "email = lower(email)")
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("users") as batch_op:
+        batch_op.drop_constraint("ck_users_email_lowercase", type_="check")
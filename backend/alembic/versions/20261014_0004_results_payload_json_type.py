@@ -0,0 +1,103 @@
+"""store results.payload_json as JSONB (Postgres) / JSON (SQLite)
+
+Revision ID: 20261014_0004
+Revises: 20261014_0003
+Create Date: 2026-10-14
+
+The payload used to be an opaque string that the API passed through. Native JSON
+lets the database parse/compress it (TOAST on Postgres) and makes key queries
+and GIN indexes possible later. The API now exchanges payloads as JSON objects;
+legacy non-object payloads are wrapped as {"value": <payload>}.
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "20261014_0004"
+down_revision = "20261014_0003"
+branch_labels = None
+depends_on = None
+
+
+def _recreate_user_created_index() -> None:
+    # SQLite batch mode rebuilds the table from reflection, which drops the DESC from
+    # ix_results_user_created (see 20261014_0002); restore it as the model declares it.
+    op.drop_index("ix_results_user_created", table_name="results")
+    op.create_index(
+        "ix_results_user_created",
+        "results",
+        ["user_id", sa.text("created_at DESC")],
+        unique=False,
+    )
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        # The old schema only required a non-empty string, so some rows may not be JSON at
+        # all; a bare ::jsonb cast would abort the migration on them. Turn those into JSON
+        # string literals first (the USING clause below then wraps them like SQLite does).
+        op.execute(
+            """
+            CREATE FUNCTION pg_temp.myfuture_is_json(value text) RETURNS boolean AS $$
+            BEGIN
+                PERFORM value::jsonb;
+                RETURN true;
+            EXCEPTION WHEN others THEN
+                RETURN false;
+            END;
+            $$ LANGUAGE plpgsql IMMUTABLE
+            """
+        )
+        op.execute(
+            "UPDATE results SET payload_json = to_jsonb(payload_json)::text "
+            "WHERE NOT pg_temp.myfuture_is_json(payload_json)"
+        )
+        op.execute("DROP FUNCTION pg_temp.myfuture_is_json(text)")
+
+        op.alter_column(
+            "results",
+            "payload_json",
+            type_=postgresql.JSONB(),
+            postgresql_using=(
+                "CASE WHEN jsonb_typeof(payload_json::jsonb) = 'object' THEN payload_json::jsonb "
+                "ELSE jsonb_build_object('value', payload_json::jsonb) END"
+            ),
+            existing_nullable=False,
+        )
+        return
+
+    # SQLite stores JSON as text: keep objects as-is and wrap everything else.
+    op.execute(
+        "UPDATE results SET payload_json = json_object('value', payload_json) "
+        "WHERE json_valid(payload_json) = 0"
+    )
+    op.execute(
+        "UPDATE results SET payload_json = json_object('value', json(payload_json)) "
+        "WHERE json_type(payload_json) <> 'object'"
+    )
+    with op.batch_alter_table("results") as batch_op:
+        batch_op.alter_column("payload_json", type_=sa.JSON(), existing_nullable=False)
+    _recreate_user_created_index()
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        op.alter_column(
+            "results",
+            "payload_json",
+            type_=sa.String(),
+            postgresql_using="payload_json::text",
+            existing_nullable=False,
+        )
+        return
+
+    with op.batch_alter_table("results") as batch_op:
+        batch_op.alter_column("payload_json", type_=sa.String(), existing_nullable=False)
+    _recreate_user_created_index()
@@ -0,0 +1,52 @@
+"""partial indexes on users token hash columns
+
+Revision ID: 20261014_0005
+Revises: 20261014_0004
+Create Date: 2026-10-14
+
+Verification/reset token hashes are NULL for almost every user. Partial indexes
+(`WHERE ... IS NOT NULL`) only hold pending tokens, keeping the verify/reset
+lookup index tiny and cache-resident.
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261014_0005"
+down_revision = "20261014_0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.drop_index("ix_users_email_verification_token_hash", table_name="users")
+    op.drop_index("ix_users_password_reset_token_hash", table_name="users")
+
+    op.create_index(
+        "ix_users_evt",
+        "users",
+        ["email_verification_token_hash"],
+        unique=False,
+        postgresql_where=sa.text("email_verification_token_hash IS NOT NULL"),
+        sqlite_where=sa.text("email_verification_token_hash IS NOT NULL"),
+    )
+    op.create_index(
+        "ix_users_prt",
+        "users",
+        ["password_reset_token_hash"],
+        unique=False,
+        postgresql_where=sa.text("password_reset_token_hash IS NOT NULL"),
+        sqlite_where=sa.text("password_reset_token_hash IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_users_prt", table_name="users")
+    op.drop_index("ix_users_evt", table_name="users")
+
+    op.create_index("ix_users_email_verification_token_hash", "users", ["email_verification_token_hash"], unique=False)
+    op.create_index("ix_users_password_reset_token_hash", "users", ["password_reset_token_hash"], unique=False)
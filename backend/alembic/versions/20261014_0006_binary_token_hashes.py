@@ -0,0 +1,85 @@
+"""store users token hashes as raw 32-byte digests
+
+Revision ID: 20261014_0006
+Revises: 20261014_0005
+Create Date: 2026-10-14
+
+Verification/reset token hashes were stored as 64-char hex strings in
+String(128) columns. Raw HMAC-SHA256 digests (bytea / BLOB) halve the index
+key size, so more keys fit per B-tree page on verify/reset lookups.
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261014_0006"
+down_revision = "20261014_0005"
+branch_labels = None
+depends_on = None
+
+_COLUMNS = ("email_verification_token_hash", "password_reset_token_hash")
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        for column in _COLUMNS:
+            op.alter_column(
+                "users",
+                column,
+                type_=sa.LargeBinary(32),
+                postgresql_using=f"decode({column}, 'hex')",
+                existing_nullable=True,
+            )
+        return
+
+    # SQLite: unhex() needs 3.41+, so decode the (few) pending tokens in Python.
+    users = sa.table("users", sa.column("id"), *(sa.column(c) for c in _COLUMNS))
+    for column in _COLUMNS:
+        rows = bind.execute(
+            sa.select(users.c.id, users.c[column]).where(users.c[column].is_not(None))
+        ).all()
+        for user_id, hex_digest in rows:
+            bind.execute(
+                users.update()
+                .where(users.c.id == user_id)
+                .values({column: bytes.fromhex(hex_digest)})
+            )
+
+    with op.batch_alter_table("users") as batch_op:
+        for column in _COLUMNS:
+            batch_op.alter_column(
+                column,
+                type_=sa.LargeBinary(32),
+                existing_type=sa.String(128),
+                existing_nullable=True,
+            )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        for column in _COLUMNS:
+            op.alter_column(
+                "users",
+                column,
+                type_=sa.String(128),
+                postgresql_using=f"encode({column}, 'hex')",
+                existing_nullable=True,
+            )
+        return
+
+    for column in _COLUMNS:
+        op.execute(f"UPDATE users SET {column} = lower(hex({column})) WHERE {column} IS NOT NULL")
+    with op.batch_alter_table("users") as batch_op:
+        for column in _COLUMNS:
+            batch_op.alter_column(
+                column,
+                type_=sa.String(128),
+                existing_type=sa.LargeBinary(32),
+                existing_nullable=True,
+            )
@@ -0,0 +1,65 @@
+"""index users by email_hash instead of email
+
+Revision ID: 20261014_0007
+Revises: 20261014_0006
+Create Date: 2026-10-14
+
+Lookups by email now go through a 32-byte SHA-256 of the lowercase email
+(`email_hash`, unique). Its index is far smaller than a unique index on a
+VARCHAR(320), so login/register/reset lookups touch fewer pages. `email` is
+kept, unindexed, for display and mail delivery.
+"""
+
+from __future__ import annotations
+
+import hashlib
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261014_0007"
+down_revision = "20261014_0006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    existing_indexes = {idx["name"] for idx in inspector.get_indexes("users")}
+    existing_uniques = {uc["name"] for uc in inspector.get_unique_constraints("users")}
+
+    op.add_column("users", sa.Column("email_hash", sa.LargeBinary(length=32), nullable=True))
+
+    # Emails are already lowercase (ck_users_email_lowercase), so hash them as stored.
+    if bind.dialect.name == "postgresql":
+        op.execute("UPDATE users SET email_hash = sha256(convert_to(email, 'UTF8'))")
+    else:
+        users = sa.table("users", sa.column("id"), sa.column("email"), sa.column("email_hash"))
+        for user_id, email in bind.execute(sa.select(users.c.id, users.c.email)).all():
+            bind.execute(
+                users.update()
+                .where(users.c.id == user_id)
+                .values(email_hash=hashlib.sha256(email.lower().encode("utf-8")).digest())
+            )
+
+    with op.batch_alter_table("users") as batch_op:
+        batch_op.alter_column(
+            "email_hash",
+            existing_type=sa.LargeBinary(length=32),
+            nullable=False,
+        )
+        if "uq_users_email" in existing_uniques:
+            batch_op.drop_constraint("uq_users_email", type_="unique")
+        if "ix_users_email" in existing_indexes:
+            batch_op.drop_index("ix_users_email")
+        batch_op.create_index("ix_users_email_hash", ["email_hash"], unique=True)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("users") as batch_op:
+        batch_op.drop_index("ix_users_email_hash")
+        batch_op.create_index("ix_users_email", ["email"], unique=True)
+        batch_op.drop_column("email_hash")
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+from datetime import datetime
+
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 from fastapi import Query
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.db.session import get_db
+from app.dependencies.clock import get_request_time
 from app.schemas.auth import (
     ForgotPasswordRequest,
     GoogleLoginRequest,
@@ -23,35 +26,27 @@ router = APIRouter(prefix=f"{settings.api_prefix}/auth", tags=["auth"])
 
 
 def _build_frontend_verify_link(*, token: str) -> str:
-    base = settings.frontend_base_url.strip().rstrip("/")
-    if not (base.startswith("http://") or base.startswith("https://")):
-        scheme = "http" if settings.environment == "development" else "https"
-        base = f"{scheme}://{base}"
-
-    return f"{base}/verify-email?token={token}"
+    return f"{settings.frontend_base_url_normalized}/verify-email?token={token}"
 
 
 def _build_frontend_reset_link(*, token: str) -> str:
-    base = settings.frontend_base_url.strip().rstrip("/")
-    if not (base.startswith("http://") or base.startswith("https://")):
-        scheme = "http" if settings.environment == "development" else "https"
-        base = f"{scheme}://{base}"
-
-    return f"{base}/reset-password?token={token}"
+    return f"{settings.frontend_base_url_normalized}/reset-password?token={token}"
 
 
 @router.post("/register", response_model=NeutralMessageResponse)
-def register(
+async def register(
     payload: RegisterRequest,
     background_tasks: BackgroundTasks,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
+    now: datetime = Depends(get_request_time),
 ) -> NeutralMessageResponse:
     service = AuthService(db)
     try:
-        user, verification_token = service.register(
-            email=str(payload.email).lower(),
+        user, verification_token = await service.register(
+            email=payload.email,
             password=payload.password,
             username=payload.username,
+            now=now,
         )
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
@@ -67,13 +62,14 @@ def register(
 
 
 @router.get("/verify-email")
-def verify_email(
+async def verify_email(
     token: str = Query(min_length=10),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
+    now: datetime = Depends(get_request_time),
 ) -> dict:
     service = AuthService(db)
     try:
-        service.verify_email(token=token)
+        await service.verify_email(token=token, now=now)
     except ValueError:
         # Do not leak whether a user exists; keep response generic.
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid or expired token")
@@ -82,10 +78,10 @@ def verify_email(
 
 
 @router.post("/login", response_model=TokenResponse)
-def login(payload: LoginRequest, db: Session = Depends(get_db)) -> TokenResponse:
+async def login(payload: LoginRequest, db: AsyncSession = Depends(get_db)) -> TokenResponse:
     service = AuthService(db)
     try:
-        user = service.login(email=str(payload.email).lower(), password=payload.password)
+        user = await service.login(email=payload.email, password=payload.password)
     except ValueError:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
 
@@ -97,17 +93,18 @@ def login(payload: LoginRequest, db: Session = Depends(get_db)) -> TokenResponse
 
 
 @router.post("/forgot-password", response_model=NeutralMessageResponse)
-def forgot_password(
+async def forgot_password(
     payload: ForgotPasswordRequest,
     background_tasks: BackgroundTasks,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
+    now: datetime = Depends(get_request_time),
 ) -> NeutralMessageResponse:
     # Always return a neutral message to prevent account enumeration.
     neutral = "If an account exists, a reset link has been sent."
 
     service = AuthService(db)
-    email = str(payload.email).lower()
-    token = service.request_password_reset(email=email)
+    email = payload.email
+    token = await service.request_password_reset(email=email, now=now)
     if token:
         reset_link = _build_frontend_reset_link(token=token)
         email_service = ConsoleEmailService()
@@ -120,10 +117,18 @@ def forgot_password(
 
 
 @router.post("/reset-password")
-def reset_password(payload: ResetPasswordRequest, db: Session = Depends(get_db)) -> dict:
+async def reset_password(
+    payload: ResetPasswordRequest,
+    db: AsyncSession = Depends(get_db),
+    now: datetime = Depends(get_request_time),
+) -> dict:
     service = AuthService(db)
     try:
-        service.reset_password(token=payload.token, new_password=payload.new_password)
+        await service.reset_password(
+            token=payload.token,
+            new_password=payload.new_password,
+            now=now,
+        )
     except ValueError:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid or expired token")
 
@@ -131,10 +136,14 @@ def reset_password(payload: ResetPasswordRequest, db: Session = Depends(get_db))
 
 
 @router.post("/google", response_model=TokenResponse)
-def google_login(payload: GoogleLoginRequest, db: Session = Depends(get_db)) -> TokenResponse:
+async def google_login(
+    payload: GoogleLoginRequest,
+    db: AsyncSession = Depends(get_db),
+    now: datetime = Depends(get_request_time),
+) -> TokenResponse:
     service = AuthService(db)
     try:
-        user = service.login_with_google(id_token=payload.id_token)
+        user = await service.login_with_google(id_token=payload.id_token, now=now)
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(exc))
 
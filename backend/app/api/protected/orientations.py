@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-import uuid
-
 from fastapi import APIRouter, Depends
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from pydantic import TypeAdapter
+from sqlalchemy import bindparam, insert, lambda_stmt, select
+from sqlalchemy.ext.asyncio import AsyncSession
+import uuid_utils
 
 from app.core.config import settings
 from app.db.session import get_db
@@ -15,48 +15,60 @@ from app.schemas.orientation import OrientationCreate, OrientationRead
 
 router = APIRouter(prefix=f"{settings.api_prefix}/orientations", tags=["orientations"])
 
+# Built once; validates whole result sets in a single pydantic-core call.
+_orientations_adapter = TypeAdapter(list[OrientationRead])
+
+# lambda_stmt: construction and cache-key generation happen once, keyed by the lambda.
+# Column list (not the entity) skips ORM identity-map bookkeeping for read-only rows.
+_list_orientations_stmt = lambda_stmt(
+    lambda: select(
+        Orientation.id,
+        Orientation.user_id,
+        Orientation.level,
+        Orientation.input_method,
+        Orientation.created_at,
+    )
+    .where(Orientation.user_id == bindparam("uid"))
+    .order_by(Orientation.created_at.desc())
+)
+
 
 @router.post("", response_model=OrientationRead)
-def create_orientation(
+async def create_orientation(
     payload: OrientationCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_verified_user),
 ) -> OrientationRead:
-    orientation = Orientation(
-        id=str(uuid.uuid4()),
-        user_id=current_user.id,
-        level=payload.level,
-        input_method=payload.input_method,
-    )
-    db.add(orientation)
-    db.commit()
-    db.refresh(orientation)
-
-    return OrientationRead(
-        id=orientation.id,
-        user_id=orientation.user_id,
-        level=orientation.level,
-        input_method=orientation.input_method,
-        created_at=orientation.created_at,
-    )
+    # Single round-trip: INSERT ... RETURNING (native on Postgres, SQLite >= 3.35).
+    row = (
+        await db.execute(
+            insert(Orientation)
+            .values(
+                # Time-ordered UUIDv7: new rows append to the right edge of the PK index.
+                id=str(uuid_utils.uuid7()),
+                user_id=current_user.id,
+                level=payload.level,
+                input_method=payload.input_method,
+            )
+            .returning(
+                Orientation.id,
+                Orientation.user_id,
+                Orientation.level,
+                Orientation.input_method,
+                Orientation.created_at,
+            )
+        )
+    ).mappings().one()
+    await db.commit()
+
+    return OrientationRead.model_validate(row)
 
 
 @router.get("/me", response_model=list[OrientationRead])
-def list_my_orientations(
-    db: Session = Depends(get_db),
+async def list_my_orientations(
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_verified_user),
 ) -> list[OrientationRead]:
-    items = db.scalars(
-        select(Orientation).where(Orientation.user_id == current_user.id).order_by(Orientation.created_at.desc())
-    ).all()
-
-    return [
-        OrientationRead(
-            id=o.id,
-            user_id=o.user_id,
-            level=o.level,
-            input_method=o.input_method,
-            created_at=o.created_at,
-        )
-        for o in items
-    ]
+    rows = await db.execute(_list_orientations_stmt, {"uid": current_user.id})
+
+    return _orientations_adapter.validate_python(rows.mappings().all())
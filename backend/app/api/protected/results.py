@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-import uuid
-
 from fastapi import APIRouter, Depends
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from pydantic import TypeAdapter
+from sqlalchemy import bindparam, insert, lambda_stmt, select
+from sqlalchemy.ext.asyncio import AsyncSession
+import uuid_utils
 
 from app.core.config import settings
 from app.dependencies.auth import get_verified_user
@@ -15,45 +15,59 @@ from app.schemas.result import ResultCreate, ResultRead
 
 router = APIRouter(prefix=f"{settings.api_prefix}/results", tags=["results"])
 
+# Built once; validates whole result sets in a single pydantic-core call.
+_results_adapter = TypeAdapter(list[ResultRead])
+
+# lambda_stmt: construction and cache-key generation happen once, keyed by the lambda.
+# Column list (not the entity) skips ORM identity-map bookkeeping for read-only rows.
+_list_results_stmt = lambda_stmt(
+    lambda: select(
+        Result.id,
+        Result.user_id,
+        Result.orientation_id,
+        Result.payload_json,
+        Result.created_at,
+    )
+    .where(Result.user_id == bindparam("uid"))
+    .order_by(Result.created_at.desc())
+)
+
 
 @router.post("", response_model=ResultRead)
-def create_result(
+async def create_result(
     payload: ResultCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_verified_user),
 ) -> ResultRead:
-    result = Result(
-        id=str(uuid.uuid4()),
-        user_id=current_user.id,
-        orientation_id=payload.orientation_id,
-        payload_json=payload.payload_json,
-    )
-    db.add(result)
-    db.commit()
-    db.refresh(result)
-
-    return ResultRead(
-        id=result.id,
-        user_id=result.user_id,
-        orientation_id=result.orientation_id,
-        payload_json=result.payload_json,
-        created_at=result.created_at,
-    )
+    # Single round-trip: INSERT ... RETURNING (native on Postgres, SQLite >= 3.35).
+    row = (
+        await db.execute(
+            insert(Result)
+            .values(
+                # Time-ordered UUIDv7: new rows append to the right edge of the PK index.
+                id=str(uuid_utils.uuid7()),
+                user_id=current_user.id,
+                orientation_id=payload.orientation_id,
+                payload_json=payload.payload_json,
+            )
+            .returning(
+                Result.id,
+                Result.user_id,
+                Result.orientation_id,
+                Result.payload_json,
+                Result.created_at,
+            )
+        )
+    ).mappings().one()
+    await db.commit()
+
+    return ResultRead.model_validate(row)
 
 
 @router.get("/me", response_model=list[ResultRead])
-def list_my_results(
-    db: Session = Depends(get_db),
+async def list_my_results(
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_verified_user),
 ) -> list[ResultRead]:
-    items = db.scalars(select(Result).where(Result.user_id == current_user.id).order_by(Result.created_at.desc())).all()
-    return [
-        ResultRead(
-            id=r.id,
-            user_id=r.user_id,
-            orientation_id=r.orientation_id,
-            payload_json=r.payload_json,
-            created_at=r.created_at,
-        )
-        for r in items
-    ]
+    rows = await db.execute(_list_results_stmt, {"uid": current_user.id})
+    return _results_adapter.validate_python(rows.mappings().all())
@@ -1,23 +1,48 @@
 from __future__ import annotations
 
-from fastapi import APIRouter
+import hashlib
+from typing import Any
+
+from fastapi import APIRouter, Request, Response
+import orjson
 
 from app.core.config import settings
 
 router = APIRouter(prefix=f"{settings.api_prefix}/public", tags=["public"])
 
+_CACHE_CONTROL = "public, max-age=3600"
+
+
+def _precompute(payload: dict[str, Any]) -> tuple[bytes, str]:
+    # Constant payloads: serialize and fingerprint once at import, not per request.
+    body = orjson.dumps(payload)
+    return body, f'"{hashlib.sha256(body).hexdigest()}"'
+
+
+def _static_json_response(request: Request, precomputed: tuple[bytes, str]) -> Response:
+    body, etag = precomputed
+    headers = {"Cache-Control": _CACHE_CONTROL, "ETag": etag}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+_CAREERS = _precompute({"items": ["Software Engineer", "Data Analyst", "Nurse", "Teacher"]})
+_FIELDS = _precompute({"items": ["Computer Science", "Health", "Education", "Business"]})
+_TRENDS = _precompute({"items": ["AI", "Cybersecurity", "Green jobs"]})
+
 
 @router.get("/careers")
-def list_careers() -> dict:
+async def list_careers(request: Request) -> Response:
     # Public, non-personal endpoint: no auth, no DB writes.
-    return {"items": ["Software Engineer", "Data Analyst", "Nurse", "Teacher"]}
+    return _static_json_response(request, _CAREERS)
 
 
 @router.get("/fields")
-def list_fields() -> dict:
-    return {"items": ["Computer Science", "Health", "Education", "Business"]}
+async def list_fields(request: Request) -> Response:
+    return _static_json_response(request, _FIELDS)
 
 
 @router.get("/trends")
-def list_trends() -> dict:
-    return {"items": ["AI", "Cybersecurity", "Green jobs"]}
+async def list_trends(request: Request) -> Response:
+    return _static_json_response(request, _TRENDS)
@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import os
+from functools import cached_property, lru_cache
+
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -17,6 +21,8 @@ class Settings(BaseSettings):
     jwt_secret_key: str = "CHANGE_ME"
     jwt_algorithm: str = "HS256"
     jwt_access_token_minutes: int = 30
+    # Password hashing worker processes (CPU/memory-bound); defaults to the CPU count.
+    hash_concurrency: int = Field(default_factory=lambda: os.cpu_count() or 4)
 
     # Email verification
     # Used to build verification links like: https://<frontend-domain>/verify-email?token=...
@@ -26,6 +32,11 @@ class Settings(BaseSettings):
     # Optional separate secret; defaults to jwt_secret_key when empty.
     email_verification_secret_key: str = ""
 
+    # Login throttling: per-email token bucket of `login_rate_limit_attempts` credits,
+    # refilled evenly over `login_rate_limit_window_seconds`.
+    login_rate_limit_attempts: int = 10
+    login_rate_limit_window_seconds: int = 300
+
     # Password reset
     password_reset_token_minutes: int = 30
     password_reset_request_cooldown_seconds: int = 60
@@ -34,6 +45,11 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str = "sqlite:///./myfuture.db"
+    # Connection pool (per process); defaults sized for a single uvicorn worker.
+    db_pool_size: int = 20
+    db_max_overflow: int = 10
+    db_pool_timeout: int = 30
+    db_pool_recycle: int = 1800
 
     # CORS (frontend -> API)
     # Comma-separated list of allowed origins.
@@ -47,5 +63,22 @@ class Settings(BaseSettings):
     google_tokeninfo_url: str = "https://oauth2.googleapis.com/tokeninfo"
     google_client_id: str = ""
 
+    @cached_property
+    def frontend_base_url_normalized(self) -> str:
+        # Accept values with or without scheme / trailing slash; computed once per process.
+        base = self.frontend_base_url.strip().rstrip("/")
+        if not (base.startswith("http://") or base.startswith("https://")):
+            scheme = "http" if self.environment == "development" else "https"
+            base = f"{scheme}://{base}"
+        return base
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    # Parse env / .env files once per process. Modules read the import-time `settings`
+    # below (router prefixes, engine, secrets), so overrides must be in the environment
+    # before the app is imported.
+    return Settings()
+
 
-settings = Settings()
+settings = get_settings()
@@ -1,56 +1,197 @@
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from functools import lru_cache
+from typing import Any, TypeVar
 import hashlib
 import hmac
+import multiprocessing
 import secrets
-import re
+import string
 
-from jose import JWTError, jwt
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+import jwt
 import bcrypt
 
 from app.core.config import settings
 
+# argon2id at the OWASP minimum profile (46 MiB, t=1, p=1). One shared instance; hashes
+# with other parameters are upgraded on the next successful login (check_needs_rehash).
+_password_hasher = PasswordHasher(
+    time_cost=1,
+    memory_cost=46 * 1024,
+    parallelism=1,
+    hash_len=32,
+    salt_len=16,
+)
+
+# Hashes created before the argon2id switch; verified with bcrypt and rehashed on login.
+_LEGACY_BCRYPT_PREFIXES = ("$2a$", "$2b$", "$2y$")
 _BCRYPT_MAX_PASSWORD_BYTES = 72
 
-_PASSWORD_SPECIAL_RE = re.compile(r"[^A-Za-z0-9]")
+_T = TypeVar("_T")
+
+# Token HMAC secrets, encoded once; separate secrets default to jwt_secret_key when empty.
+_EMAIL_VERIFICATION_SECRET = (
+    settings.email_verification_secret_key or settings.jwt_secret_key
+).encode("utf-8")
+_PASSWORD_RESET_SECRET = (settings.password_reset_secret_key or settings.jwt_secret_key).encode("utf-8")
+
+# Character classes required by the password policy, tallied in a single pass.
+_PASSWORD_UPPER = frozenset(string.ascii_uppercase)
+_PASSWORD_LOWER = frozenset(string.ascii_lowercase)
+_PASSWORD_DIGITS = frozenset(string.digits)
+_HAS_UPPER, _HAS_LOWER, _HAS_DIGIT, _HAS_SPECIAL = 1, 2, 4, 8
+_HAS_ALL = _HAS_UPPER | _HAS_LOWER | _HAS_DIGIT | _HAS_SPECIAL
+_PASSWORD_CLASS_RULES = (
+    (_HAS_UPPER, "Password must contain at least one uppercase letter"),
+    (_HAS_LOWER, "Password must contain at least one lowercase letter"),
+    (_HAS_DIGIT, "Password must contain at least one number"),
+    (_HAS_SPECIAL, "Password must contain at least one special character"),
+)
 
 
 def validate_password_strength(password: str) -> None:
     # Backend must enforce rules (do not rely on frontend validation).
-    # bcrypt only uses the first 72 bytes of the password (UTF-8).
-    password_bytes = len(password.encode("utf-8"))
-    if password_bytes > _BCRYPT_MAX_PASSWORD_BYTES:
-        raise ValueError(
-            "Password is too long for bcrypt (max 72 bytes, got "
-            f"{password_bytes}). Remove emojis/hidden characters and try again."
-        )
     if len(password) < 8:
         raise ValueError("Password must be at least 8 characters")
-    if re.search(r"[A-Z]", password) is None:
-        raise ValueError("Password must contain at least one uppercase letter")
-    if re.search(r"[a-z]", password) is None:
-        raise ValueError("Password must contain at least one lowercase letter")
-    if re.search(r"[0-9]", password) is None:
-        raise ValueError("Password must contain at least one number")
-    if _PASSWORD_SPECIAL_RE.search(password) is None:
-        raise ValueError("Password must contain at least one special character")
+
+    flags = 0
+    for ch in password:
+        if ch in _PASSWORD_UPPER:
+            flags |= _HAS_UPPER
+        elif ch in _PASSWORD_LOWER:
+            flags |= _HAS_LOWER
+        elif ch in _PASSWORD_DIGITS:
+            flags |= _HAS_DIGIT
+        else:
+            # Anything outside ASCII letters/digits counts as special.
+            flags |= _HAS_SPECIAL
+        if flags == _HAS_ALL:
+            return
+
+    for flag, message in _PASSWORD_CLASS_RULES:
+        if not flags & flag:
+            raise ValueError(message)
 
 
 def hash_password(password: str) -> str:
     validate_password_strength(password)
-    hashed = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds=12))
-    return hashed.decode("utf-8")
+    return _password_hasher.hash(password)
+
+
+def rehash_password(password: str) -> str:
+    # For already-verified passwords (legacy migration); skips the strength policy.
+    return _password_hasher.hash(password)
+
+
+def _is_legacy_password_hash(password_hash: str) -> bool:
+    return password_hash.startswith(_LEGACY_BCRYPT_PREFIXES)
 
 
 def verify_password(password: str, password_hash: str) -> bool:
+    if _is_legacy_password_hash(password_hash):
+        # bcrypt only uses the first 72 bytes of the password (UTF-8); longer inputs never matched.
+        password_bytes = password.encode("utf-8")
+        if len(password_bytes) > _BCRYPT_MAX_PASSWORD_BYTES:
+            return False
+        try:
+            return bcrypt.checkpw(password_bytes, password_hash.encode("utf-8"))
+        except Exception:
+            return False
+
+    try:
+        return _password_hasher.verify(password_hash, password)
+    except (VerificationError, InvalidHashError):
+        return False
+
+
+@lru_cache(maxsize=1)
+def _dummy_password_hash() -> str:
+    # Built lazily in the hashing worker that first needs it (not at import in every worker).
+    return _password_hasher.hash(secrets.token_urlsafe(16))
+
+
+def verify_dummy_password(password: str) -> bool:
+    """Spend the same verify work as a real login, against a hash nothing can match.
+
+    Used when there is no real hash to check (unknown email, OAuth-only account) so
+    response timing doesn't reveal which case applied.
+    """
+    verify_password(password, _dummy_password_hash())
+    return False
+
+
+def password_needs_rehash(password_hash: str) -> bool:
+    if _is_legacy_password_hash(password_hash):
+        return True
     try:
-        return bcrypt.checkpw(password.encode("utf-8"), password_hash.encode("utf-8"))
-    except Exception:
+        return _password_hasher.check_needs_rehash(password_hash)
+    except InvalidHashError:
         return False
 
 
+@lru_cache(maxsize=1)
+def _hash_executor() -> ProcessPoolExecutor:
+    # Dedicated, long-lived hashing workers (one per core by default): argon2's memory-hard
+    # work and its allocator churn stay out of the API process, and a login burst queues
+    # here instead of starving the threadpool shared with other blocking calls.
+    # "spawn": forking a process that runs an event loop and threads is unsafe.
+    return ProcessPoolExecutor(
+        max_workers=settings.hash_concurrency,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+
+def _warm_hash_worker() -> None:
+    # Runs in the worker: unpickling this call imports this module there.
+    return None
+
+
+async def start_hash_pool() -> None:
+    # Spawn every worker (and its imports) at startup instead of on the first logins. Workers
+    # are spawned on demand, so submit one task per worker before any of them is idle.
+    loop = asyncio.get_running_loop()
+    executor = _hash_executor()
+    warmups = [
+        loop.run_in_executor(executor, _warm_hash_worker) for _ in range(settings.hash_concurrency)
+    ]
+    await asyncio.gather(*warmups)
+
+
+def _replace_broken_hash_pool(broken: ProcessPoolExecutor) -> None:
+    # Concurrent callers all see the same broken pool; only the first one replaces it.
+    if _hash_executor.cache_info().currsize and _hash_executor() is broken:
+        broken.shutdown(wait=False, cancel_futures=True)
+        _hash_executor.cache_clear()
+
+
+async def run_in_hash_pool(func: Callable[..., _T], *args: Any) -> _T:
+    """Run a password hashing/verification call on the hashing worker pool.
+
+    `func` must be a module-level (picklable) function such as `hash_password`.
+    A pool broken by a dead worker (e.g. OOM-killed) is replaced and the call retried once.
+    """
+    loop = asyncio.get_running_loop()
+    executor = _hash_executor()
+    try:
+        return await loop.run_in_executor(executor, func, *args)
+    except BrokenProcessPool:
+        _replace_broken_hash_pool(executor)
+    return await loop.run_in_executor(_hash_executor(), func, *args)
+
+
+def shutdown_hash_pool() -> None:
+    if _hash_executor.cache_info().currsize:
+        _hash_executor().shutdown(cancel_futures=True)
+        _hash_executor.cache_clear()
+
+
 def create_access_token(*, subject: str, extra_claims: dict[str, Any] | None = None) -> str:
     now = datetime.now(timezone.utc)
     expires_delta = timedelta(minutes=settings.jwt_access_token_minutes)
@@ -68,21 +209,31 @@ def create_access_token(*, subject: str, extra_claims: dict[str, Any] | None = N
 
 def decode_token(token: str) -> dict[str, Any]:
     try:
-        return jwt.decode(token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm])
-    except JWTError as exc:
+        return jwt.decode(
+            token,
+            settings.jwt_secret_key,
+            algorithms=[settings.jwt_algorithm],
+            options={"require": ["exp", "iat", "sub"]},
+        )
+    except jwt.PyJWTError as exc:
         raise ValueError("Invalid token") from exc
 
 
+def hash_email(email: str) -> bytes:
+    # Lookup key for users.email_hash: SHA-256 of the lowercase email (32-byte index keys
+    # instead of up-to-320-char strings). Not a secret; emails are stored alongside.
+    return hashlib.sha256(email.lower().encode("utf-8")).digest()
+
+
 def generate_email_verification_token() -> str:
     # URL-safe random token; never store this value.
     return secrets.token_urlsafe(32)
 
 
-def hash_email_verification_token(token: str) -> str:
-    # HMAC-SHA256 of the token using a server secret.
-    secret = settings.email_verification_secret_key or settings.jwt_secret_key
-    digest = hmac.new(secret.encode("utf-8"), token.encode("utf-8"), hashlib.sha256).hexdigest()
-    return digest
+def hash_email_verification_token(token: str) -> bytes:
+    # HMAC-SHA256 of the token using a server secret (one-shot OpenSSL path). Stored as the
+    # raw 32-byte digest: half the index key size of the hex form.
+    return hmac.digest(_EMAIL_VERIFICATION_SECRET, token.encode("utf-8"), "sha256")
 
 
 def generate_password_reset_token() -> str:
@@ -90,7 +241,5 @@ def generate_password_reset_token() -> str:
     return secrets.token_urlsafe(32)
 
 
-def hash_password_reset_token(token: str) -> str:
-    secret = settings.password_reset_secret_key or settings.jwt_secret_key
-    digest = hmac.new(secret.encode("utf-8"), token.encode("utf-8"), hashlib.sha256).hexdigest()
-    return digest
+def hash_password_reset_token(token: str) -> bytes:
+    return hmac.digest(_PASSWORD_RESET_SECRET, token.encode("utf-8"), "sha256")
@@ -1,28 +1,83 @@
 from __future__ import annotations
 
-from collections.abc import Generator
+from collections.abc import AsyncGenerator
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy import event
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.pool import QueuePool
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 
 from app.core.config import settings
 
-_engine = create_engine(
-    settings.database_url,
-    connect_args={"check_same_thread": False} if settings.database_url.startswith("sqlite") else {},
+# Plain URLs (shared with Alembic, which stays sync) are mapped to their async driver.
+_ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+
+
+def _async_database_url(database_url: str) -> URL:
+    url = make_url(database_url)
+    async_driver = _ASYNC_DRIVERS.get(url.drivername)
+    return url.set(drivername=async_driver) if async_driver else url
+
+
+def _queue_pool_args(url: URL) -> dict[str, int]:
+    # Sizing only applies to queue pools; e.g. in-memory SQLite gets a StaticPool, which
+    # rejects these arguments.
+    if not issubclass(url.get_dialect().get_pool_class(url), QueuePool):
+        return {}
+    return {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+    }
+
+
+_is_sqlite = settings.database_url.startswith("sqlite")
+_database_url = _async_database_url(settings.database_url)
+
+_engine = create_async_engine(
+    _database_url,
+    connect_args={"check_same_thread": False} if _is_sqlite else {},
+    **_queue_pool_args(_database_url),
+    pool_recycle=settings.db_pool_recycle,
     pool_pre_ping=True,
+    # Room for every distinct statement the app issues, so compiled SQL is reused for the
+    # process lifetime.
+    query_cache_size=1200,
 )
 
-SessionLocal = sessionmaker(bind=_engine, autocommit=False, autoflush=False, class_=Session)
+if _is_sqlite:
+
+    @event.listens_for(_engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+        # WAL lets readers proceed during writes; NORMAL sync is safe with WAL and much faster.
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
+
+# expire_on_commit=False: async sessions cannot lazy-load expired attributes after commit.
+AsyncSessionLocal = async_sessionmaker(
+    bind=_engine,
+    autoflush=False,
+    expire_on_commit=False,
+    class_=AsyncSession,
+)
 
 
-def get_db() -> Generator[Session, None, None]:
-    db = SessionLocal()
-    try:
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    # FastAPI caches this dependency per request, so the route and its auth dependencies
+    # share one session (and at most one pooled connection).
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
-def get_engine():
+def get_engine() -> AsyncEngine:
     return _engine
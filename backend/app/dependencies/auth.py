@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import time
+
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy import bindparam, lambda_stmt, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.security import decode_token
 from app.db.session import get_db
@@ -11,15 +14,30 @@ from app.models.user import User
 
 _bearer = HTTPBearer(auto_error=False)
 
+# token -> (user_id, token exp). Tokens are immutable for their lifetime, so a short-lived
+# cache skips both the JWT decode and the user lookup on hot client sessions. Only verified
+# users are cached: verification then takes effect immediately instead of after the TTL.
+_token_cache: TTLCache[str, tuple[str, int]] = TTLCache(maxsize=10_000, ttl=60)
+
+_user_by_id_stmt = lambda_stmt(lambda: select(User).where(User.id == bindparam("uid")))
+
 
-def get_current_user(
+async def get_current_user(
     creds: HTTPAuthorizationCredentials | None = Depends(_bearer),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> User:
     if creds is None or not creds.credentials:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated")
 
     token = creds.credentials
+    hit = _token_cache.get(token)
+    if hit is not None:
+        user_id, exp = hit
+        if exp > time.time():
+            # Lightweight stand-in: carries only what get_verified_user and routes rely on.
+            return User(id=user_id, is_verified=True)
+        _token_cache.pop(token, None)
+
     try:
         payload = decode_token(token)
     except ValueError:
@@ -29,14 +47,18 @@ def get_current_user(
     if not user_id:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
 
-    user = db.scalar(select(User).where(User.id == user_id))
+    user = (await db.execute(_user_by_id_stmt, {"uid": user_id})).scalar_one_or_none()
     if user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
 
+    exp = payload.get("exp")
+    if user.is_verified and isinstance(exp, int):
+        _token_cache[token] = (user.id, exp)
+
     return user
 
 
-def get_verified_user(
+async def get_verified_user(
     current_user: User = Depends(get_current_user),
 ) -> User:
     if not current_user.is_verified:
@@ -0,0 +1,9 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+
+async def get_request_time() -> datetime:
+    # One timestamp per request, shared by the route and the services it calls. async so
+    # FastAPI resolves it inline rather than dispatching to the threadpool.
+    return datetime.now(timezone.utc)
@@ -1,17 +1,61 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy.exc import DBAPIError
 
 from app.api import auth as auth_router
 from app.api import public as public_router
 from app.api.protected import orientations as orientations_router
 from app.api.protected import results as results_router
 from app.core.config import settings
+from app.core.security import shutdown_hash_pool, start_hash_pool
+from app.db.session import get_engine
+from app.dependencies import auth as auth_dependencies
+from app.services.google_id_token import close_google_transport
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # Pay one-time costs at startup instead of on the first requests.
+    engine = get_engine()
+    async with engine.connect() as conn:
+        # Opens the first pooled connection (and initializes the dialect).
+        await conn.exec_driver_sql("SELECT 1")
+
+        # Execute the hottest statements once (matching no rows) so their compiled SQL is
+        # in the engine's compiled cache before the first request; a bare .compile() is
+        # never cached. A not-yet-migrated database just skips the warm-up.
+        try:
+            for stmt in (
+                orientations_router._list_orientations_stmt,
+                results_router._list_results_stmt,
+                auth_dependencies._user_by_id_stmt,
+            ):
+                await conn.execute(stmt, {"uid": ""})
+        except DBAPIError:
+            pass
+
+    await start_hash_pool()
+
+    yield
+
+    close_google_transport()
+    shutdown_hash_pool()
+    await engine.dispose()
 
 
 def create_app() -> FastAPI:
-    app = FastAPI(title="MyFuture AI API")
+    # No default_response_class: every JSON route declares a response model or return
+    # type, so FastAPI serializes it straight to bytes via pydantic-core (faster than
+    # ORJSONResponse, which is deprecated and would route through jsonable_encoder).
+    app = FastAPI(
+        title="MyFuture AI API",
+        lifespan=lifespan,
+    )
 
     allow_origins = [o.strip() for o in (settings.cors_allow_origins or "").split(",") if o.strip()]
     if allow_origins:
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timezone
 
-from sqlalchemy import DateTime, String, func
+from sqlalchemy import Index, String, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
+from app.db.types import UTCDateTime
 
 
 class Orientation(Base):
@@ -14,15 +15,27 @@ class Orientation(Base):
     id: Mapped[str] = mapped_column(String(36), primary_key=True)
 
     # Sensitive user-scoped data: always query/filter by user_id.
-    user_id: Mapped[str] = mapped_column(String(36), index=True, nullable=False)
+    # Indexed together with created_at (see ix_orientations_user_created).
+    user_id: Mapped[str] = mapped_column(String(36), nullable=False)
 
     # Minimal fields for MVP; keep DB-agnostic.
     level: Mapped[str] = mapped_column(String(32), nullable=False)
     input_method: Mapped[str] = mapped_column(String(32), nullable=False)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    # Python-side default so the value is known without re-reading the row after INSERT.
+    created_at: Mapped[datetime] = mapped_column(
+        UTCDateTime(),
+        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
+    )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
+        UTCDateTime(),
         server_default=func.now(),
         onupdate=func.now(),
     )
+
+    # Declared after the columns so the index binds to them (created_at DESC included).
+    __table_args__ = (
+        # Serves the per-user "latest first" listing without a sort step.
+        Index("ix_orientations_user_created", user_id, created_at.desc()),
+    )
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timezone
+from typing import Any
 
-from sqlalchemy import DateTime, String, func
+from sqlalchemy import JSON, Index, String, func
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
+from app.db.types import UTCDateTime
 
 
 class Result(Base):
@@ -14,12 +17,27 @@ class Result(Base):
     id: Mapped[str] = mapped_column(String(36), primary_key=True)
 
     # Sensitive user-scoped data: always query/filter by user_id.
-    user_id: Mapped[str] = mapped_column(String(36), index=True, nullable=False)
+    # Indexed together with created_at (see ix_results_user_created).
+    user_id: Mapped[str] = mapped_column(String(36), nullable=False)
 
     # Optional linkage to the orientation that produced this result.
     orientation_id: Mapped[str | None] = mapped_column(String(36), index=True, nullable=True)
 
-    # Store payload as JSON string to remain portable and simple for MVP.
-    payload_json: Mapped[str] = mapped_column(String, nullable=False)
-
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    # Native JSON: JSONB on Postgres (indexable, compressed), JSON text on SQLite.
+    payload_json: Mapped[dict[str, Any]] = mapped_column(
+        JSON().with_variant(JSONB(), "postgresql"),
+        nullable=False,
+    )
+
+    # Python-side default so the value is known without re-reading the row after INSERT.
+    created_at: Mapped[datetime] = mapped_column(
+        UTCDateTime(),
+        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
+    )
+
+    # Declared after the columns so the index binds to them (created_at DESC included).
+    __table_args__ = (
+        # Serves the per-user "latest first" listing without a sort step.
+        Index("ix_results_user_created", user_id, created_at.desc()),
+    )
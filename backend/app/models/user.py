@@ -2,18 +2,38 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, String, func
+from sqlalchemy import Boolean, CheckConstraint, Index, LargeBinary, String, func, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
+from app.db.types import UTCDateTime
 
 
 class User(Base):
     __tablename__ = "users"
+    __table_args__ = (
+        # Emails are stored lowercase so lookups never need LOWER(email).
+        CheckConstraint("email = lower(email)", name="ck_users_email_lowercase"),
+        # Token hashes are NULL for almost every user: partial indexes only hold pending tokens.
+        Index(
+            "ix_users_evt",
+            "email_verification_token_hash",
+            postgresql_where=text("email_verification_token_hash IS NOT NULL"),
+            sqlite_where=text("email_verification_token_hash IS NOT NULL"),
+        ),
+        Index(
+            "ix_users_prt",
+            "password_reset_token_hash",
+            postgresql_where=text("password_reset_token_hash IS NOT NULL"),
+            sqlite_where=text("password_reset_token_hash IS NOT NULL"),
+        ),
+    )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True)
     username: Mapped[str | None] = mapped_column(String(30), unique=True, index=True, nullable=True)
-    email: Mapped[str] = mapped_column(String(320), unique=True, index=True, nullable=False)
+    # Kept for display/mail delivery; uniqueness and lookups go through email_hash.
+    email: Mapped[str] = mapped_column(String(320), nullable=False)
+    email_hash: Mapped[bytes] = mapped_column(LargeBinary(32), unique=True, index=True, nullable=False)
     password_hash: Mapped[str | None] = mapped_column(String(255), nullable=True)
 
     # For OAuth-backed accounts
@@ -21,18 +41,19 @@ class User(Base):
 
     # Email verification (password accounts must verify before accessing sensitive features)
     is_verified: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
-    verified_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
-    email_verification_token_hash: Mapped[str | None] = mapped_column(String(128), nullable=True, index=True)
-    email_verification_expires_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    verified_at: Mapped[datetime | None] = mapped_column(UTCDateTime(), nullable=True)
+    # Raw 32-byte HMAC-SHA256 digests (see app.core.security).
+    email_verification_token_hash: Mapped[bytes | None] = mapped_column(LargeBinary(32), nullable=True)
+    email_verification_expires_at: Mapped[datetime | None] = mapped_column(UTCDateTime(), nullable=True)
 
     # Password reset (never store raw tokens)
-    password_reset_token_hash: Mapped[str | None] = mapped_column(String(128), nullable=True, index=True)
-    password_reset_expires_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
-    password_reset_requested_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    password_reset_token_hash: Mapped[bytes | None] = mapped_column(LargeBinary(32), nullable=True)
+    password_reset_expires_at: Mapped[datetime | None] = mapped_column(UTCDateTime(), nullable=True)
+    password_reset_requested_at: Mapped[datetime | None] = mapped_column(UTCDateTime(), nullable=True)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    created_at: Mapped[datetime] = mapped_column(UTCDateTime(), server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
+        UTCDateTime(),
         server_default=func.now(),
         onupdate=func.now(),
     )
@@ -1,28 +1,44 @@
 from __future__ import annotations
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
+
+from app.schemas._email import NormalizedEmail
+
+# Request bodies: unknown fields are rejected and parsed payloads are immutable. Whitespace
+# is not stripped model-wide (passwords are taken verbatim); NormalizedEmail trims emails.
+_REQUEST_CONFIG = ConfigDict(extra="forbid", frozen=True)
 
 
 class RegisterRequest(BaseModel):
+    model_config = _REQUEST_CONFIG
+
     username: str | None = Field(default=None, min_length=3, max_length=30)
-    email: EmailStr
+    email: NormalizedEmail
     password: str = Field(min_length=8, max_length=128)
 
 
 class LoginRequest(BaseModel):
-    email: EmailStr
+    model_config = _REQUEST_CONFIG
+
+    email: NormalizedEmail
     password: str
 
 
 class GoogleLoginRequest(BaseModel):
+    model_config = _REQUEST_CONFIG
+
     id_token: str = Field(min_length=10)
 
 
 class ForgotPasswordRequest(BaseModel):
-    email: EmailStr
+    model_config = _REQUEST_CONFIG
+
+    email: NormalizedEmail
 
 
 class ResetPasswordRequest(BaseModel):
+    model_config = _REQUEST_CONFIG
+
     token: str = Field(min_length=10)
     new_password: str = Field(min_length=8, max_length=128)
 
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class OrientationCreate(BaseModel):
@@ -11,6 +11,8 @@ class OrientationCreate(BaseModel):
 
 
 class OrientationRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: str
     user_id: str
     level: str
@@ -1,18 +1,21 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict
 
 
 class ResultCreate(BaseModel):
     orientation_id: str | None = None
-    payload_json: str = Field(min_length=2)
+    payload_json: dict[str, Any]
 
 
 class ResultRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: str
     user_id: str
     orientation_id: str | None = None
-    payload_json: str
+    payload_json: dict[str, Any]
     created_at: datetime | None = None
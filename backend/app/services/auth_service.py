@@ -1,119 +1,309 @@
 from __future__ import annotations
 
-import uuid
+import os
 import secrets
 import re
-from datetime import datetime, timedelta, timezone
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+import string
+import time
+from collections import deque
+from uuid import UUID
+from datetime import datetime, timedelta
+
+import anyio
+from cachetools import TTLCache
+from sqlalchemy import bindparam, case, insert, or_, select, update
+from sqlalchemy.dialects.postgresql import Insert as PgInsert, insert as pg_insert
+from sqlalchemy.dialects.sqlite import Insert as SqliteInsert, insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.core.security import (
     create_access_token,
     generate_email_verification_token,
     generate_password_reset_token,
+    hash_email,
     hash_email_verification_token,
     hash_password_reset_token,
     hash_password,
+    password_needs_rehash,
+    rehash_password,
+    run_in_hash_pool,
     validate_password_strength,
+    verify_dummy_password,
     verify_password,
 )
 from app.models.user import User
 from app.services.google_id_token import verify_google_id_token
 
 
-_USERNAME_RE = re.compile(r"^[A-Za-z0-9_]{3,30}$")
+# Allowed username charset: ASCII letters, digits, underscore; length 3-30.
+_USERNAME_CHARS = frozenset(string.ascii_letters + string.digits + "_")
+
+
+# Runs of characters outside the username charset (collapsed to one "_").
+_NON_USERNAME_CHARS = re.compile(r"[^A-Za-z0-9]+")
+
+
+def _is_valid_username(value: str) -> bool:
+    # Equivalent to fullmatch(r"[A-Za-z0-9_]{3,30}"), but the charset check runs as a
+    # single C-level set scan instead of a regex engine walk.
+    return 3 <= len(value) <= 30 and _USERNAME_CHARS.issuperset(value)
+
+
+# Statements built once at import; values bind per call, so SQLAlchemy's compiled cache
+# is hit on every execution instead of rebuilding the Select construct.
+_SEL_USER_BY_EMAIL = select(User).where(User.email_hash == bindparam("email_hash"))
+_SEL_USER_ID_BY_EMAIL = select(User.id).where(User.email_hash == bindparam("email_hash"))
+_SEL_TAKEN_USERNAMES = select(User.username).where(
+    User.username.in_(bindparam("usernames", expanding=True))
+)
+
+# Token flows are single conditional UPDATEs: the WHERE clause carries every validity check,
+# so there is no SELECT round-trip and no check-then-act race between concurrent requests.
+# A returned id means the token was valid (and has now been consumed/issued). Bound
+# parameters named after a users column are reserved by SQLAlchemy for the SET clause,
+# hence the b_ prefix on those.
+_UPD_VERIFY_EMAIL = (
+    update(User)
+    .where(
+        User.email_verification_token_hash == bindparam("token_hash"),
+        # Token should be single-use; treat as invalid once verified.
+        User.is_verified.is_(False),
+        User.email_verification_expires_at > bindparam("now"),
+    )
+    .values(
+        is_verified=True,
+        verified_at=bindparam("now"),
+        email_verification_token_hash=None,
+        email_verification_expires_at=None,
+    )
+    .returning(User.id)
+    .execution_options(synchronize_session=False)
+)
+_UPD_ISSUE_PASSWORD_RESET = (
+    update(User)
+    .where(
+        User.email_hash == bindparam("b_email_hash"),
+        # OAuth accounts cannot reset via password.
+        User.auth_provider == "password",
+        User.password_hash.is_not(None),
+        or_(
+            User.password_reset_requested_at.is_(None),
+            User.password_reset_requested_at <= bindparam("cooldown_until"),
+        ),
+    )
+    .values(
+        password_reset_token_hash=bindparam("token_hash"),
+        password_reset_expires_at=bindparam("expires_at"),
+        password_reset_requested_at=bindparam("now"),
+    )
+    .returning(User.id)
+    .execution_options(synchronize_session=False)
+)
+# Cheap token check run before the argon2 hash, so junk tokens never reach the hash pool.
+_SEL_PENDING_PASSWORD_RESET = select(User.id).where(
+    User.password_reset_token_hash == bindparam("token_hash"),
+    User.password_reset_expires_at > bindparam("now"),
+    User.auth_provider == "password",
+)
+_UPD_RESET_PASSWORD = (
+    update(User)
+    .where(
+        User.password_reset_token_hash == bindparam("token_hash"),
+        User.password_reset_expires_at > bindparam("now"),
+        # Token should only exist for password accounts.
+        User.auth_provider == "password",
+    )
+    .values(
+        password_hash=bindparam("b_password_hash"),
+        # Invalidate token immediately (single-use).
+        password_reset_token_hash=None,
+        password_reset_expires_at=None,
+        password_reset_requested_at=None,
+        # Reset implicitly verifies email (keeping an existing verified_at).
+        is_verified=True,
+        verified_at=case((User.is_verified, User.verified_at), else_=bindparam("now")),
+        email_verification_token_hash=None,
+        email_verification_expires_at=None,
+    )
+    .returning(User.id)
+    .execution_options(synchronize_session=False)
+)
+
+
+# Random v4 user ids, minted 256 at a time from one os.urandom call (one getrandom syscall
+# per batch instead of per id). deque.popleft/extend are atomic, so no lock is needed.
+_UUID_BATCH = 256
+_uuid_pool: deque[str] = deque()
+
+
+def _new_user_id() -> str:
+    try:
+        return _uuid_pool.popleft()
+    except IndexError:
+        buf = os.urandom(16 * _UUID_BATCH)
+        _uuid_pool.extend(
+            str(UUID(bytes=buf[i : i + 16], version=4)) for i in range(16, len(buf), 16)
+        )
+        return str(UUID(bytes=buf[:16], version=4))
+
+
+# email -> (credits left, last update). Bounds how much hashing work any one account can be
+# made to cost; an idle bucket is full again after one window, so entries can expire then.
+_login_buckets: TTLCache[str, tuple[float, float]] = TTLCache(
+    maxsize=100_000, ttl=settings.login_rate_limit_window_seconds
+)
+_LOGIN_BURST = float(settings.login_rate_limit_attempts)
+_LOGIN_REFILL_PER_SECOND = _LOGIN_BURST / settings.login_rate_limit_window_seconds
+
+
+def _take_login_credit(email: str) -> bool:
+    # Runs on the event loop without awaiting, so the read-modify-write is atomic.
+    now = time.monotonic()
+    credits, updated_at = _login_buckets.get(email, (_LOGIN_BURST, now))
+    credits = min(_LOGIN_BURST, credits + (now - updated_at) * _LOGIN_REFILL_PER_SECOND)
+    if credits < 1.0:
+        _login_buckets[email] = (credits, now)
+        return False
+    _login_buckets[email] = (credits - 1.0, now)
+    return True
 
 
 class AuthService:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self._db = db
 
-    def register(self, *, email: str, password: str, username: str | None = None) -> tuple[User, str]:
-        existing = self._db.scalar(select(User).where(User.email == email))
-        if existing is not None:
-            raise ValueError("Email already registered")
-
+    async def register(
+        self, *, email: str, password: str, username: str | None = None, now: datetime
+    ) -> tuple[User, str]:
         validate_password_strength(password)
 
         normalized_username = (username or "").strip() or None
-        if normalized_username is not None:
-            if _USERNAME_RE.fullmatch(normalized_username) is None:
-                raise ValueError("Username must be 3–30 characters (letters, numbers, underscore only)")
-            existing_username = self._db.scalar(select(User).where(User.username == normalized_username))
-            if existing_username is not None:
-                raise ValueError("Username already taken")
-        else:
-            normalized_username = self._generate_default_username()
+        if normalized_username is not None and not _is_valid_username(normalized_username):
+            raise ValueError("Username must be 3–30 characters (letters, numbers, underscore only)")
 
+        # Everything that needs no database runs first, so no pooled connection sits
+        # idle-in-transaction during the argon2 hash.
+        password_hash = await run_in_hash_pool(hash_password, password)
         raw_token = generate_email_verification_token()
         token_hash = hash_email_verification_token(raw_token)
-        expires_at = datetime.now(timezone.utc) + timedelta(hours=settings.email_verification_token_hours)
-
-        user = User(
-            id=str(uuid.uuid4()),
-            username=normalized_username,
-            email=email,
-            password_hash=hash_password(password),
-            auth_provider="password",
-            is_verified=False,
-            verified_at=None,
-            email_verification_token_hash=token_hash,
-            email_verification_expires_at=expires_at,
-        )
-        self._db.add(user)
-        self._db.commit()
-        self._db.refresh(user)
+        expires_at = now + timedelta(hours=settings.email_verification_token_hours)
+        email_hash = hash_email(email)
+
+        # One transaction for the username pick + insert; committed once on exit (rolled back
+        # on error).
+        async with self._db.begin():
+            if normalized_username is None:
+                normalized_username = await self._generate_default_username()
+
+            # Uniqueness is enforced by the insert itself (email_hash/username unique indexes):
+            # one round-trip instead of SELECT email + SELECT username + INSERT + refresh.
+            stmt = (
+                self._insert_ignoring_conflicts(User)
+                .values(
+                    id=_new_user_id(),
+                    username=normalized_username,
+                    email=email,
+                    email_hash=email_hash,
+                    password_hash=password_hash,
+                    auth_provider="password",
+                    is_verified=False,
+                    verified_at=None,
+                    email_verification_token_hash=token_hash,
+                    email_verification_expires_at=expires_at,
+                )
+                .on_conflict_do_nothing()
+                .returning(User)
+            )
+            user = (await self._db.execute(stmt)).scalar_one_or_none()
+            if user is None:
+                # Nothing inserted: one cheap lookup to report which unique field clashed.
+                if await self._db.scalar(_SEL_USER_ID_BY_EMAIL, {"email_hash": email_hash}) is not None:
+                    raise ValueError("Email already registered")
+                raise ValueError("Username already taken")
+
         return user, raw_token
 
+    def _insert_ignoring_conflicts(self, model: type[User]) -> PgInsert | SqliteInsert:
+        # ON CONFLICT is dialect-specific; both supported backends share the same API.
+        if self._db.get_bind().dialect.name == "postgresql":
+            return pg_insert(model)
+        return sqlite_insert(model)
 
-    def _generate_default_username(self) -> str:
+    async def _generate_default_username(self) -> str:
         # Generate a default display username when the user doesn't provide one.
         # Must be unique.
-        for _ in range(20):
-            candidate = f"user_{secrets.token_hex(3)}"  # 6 hex chars
-            existing = self._db.scalar(select(User).where(User.username == candidate))
-            if existing is None:
-                return candidate
-        raise ValueError("Unable to generate username. Please try again.")
-
-    def login(self, *, email: str, password: str) -> User:
-        user = self._db.scalar(select(User).where(User.email == email))
+        candidates = [f"user_{secrets.token_hex(3)}" for _ in range(20)]  # 6 hex chars
+        username = await self._first_available_username(candidates)
+        if username is None:
+            raise ValueError("Unable to generate username. Please try again.")
+        return username
+
+    async def _first_available_username(self, candidates: list[str]) -> str | None:
+        # One IN (...) round-trip for all candidates instead of a SELECT per candidate.
+        taken = set(await self._db.scalars(_SEL_TAKEN_USERNAMES, {"usernames": candidates}))
+        return next((c for c in candidates if c not in taken), None)
+
+    async def login(self, *, email: str, password: str) -> User:
+        if not _take_login_credit(email):
+            # Throttled: no DB round-trip and no hashing. The bucket is keyed by the submitted
+            # email, not by account existence, so this answer reveals nothing to equalize.
+            raise ValueError("Invalid credentials")
+
+        user = await self._db.scalar(_SEL_USER_BY_EMAIL, {"email_hash": hash_email(email)})
         if user is None or not user.password_hash:
+            # Equalize timing with the wrong-password path (no account enumeration).
+            await run_in_hash_pool(verify_dummy_password, password)
             raise ValueError("Invalid credentials")
-        if not verify_password(password, user.password_hash):
+        if not await run_in_hash_pool(verify_password, password, user.password_hash):
             raise ValueError("Invalid credentials")
+
+        # Transparently migrate legacy (bcrypt) or outdated hashes to the current argon2id params.
+        if password_needs_rehash(user.password_hash):
+            user.password_hash = await run_in_hash_pool(rehash_password, password)
+            self._db.add(user)
+            await self._db.commit()
         return user
 
-    def login_with_google(self, *, id_token: str) -> User:
-        claims = verify_google_id_token(id_token)
+    async def login_with_google(self, *, id_token: str, now: datetime) -> User:
+        # google-auth verification is blocking (may fetch Google's certs over HTTP).
+        claims = await anyio.to_thread.run_sync(verify_google_id_token, id_token)
 
         # If present and explicitly false, do not accept.
         if claims.email_verified is False:
             raise ValueError("Google email is not verified")
 
-        now = datetime.now(timezone.utc)
-        user = self._db.scalar(select(User).where(User.email == claims.email))
+        email_hash = hash_email(claims.email)
+        user = await self._db.scalar(_SEL_USER_BY_EMAIL, {"email_hash": email_hash})
 
         if user is None:
-            username = self._derive_username_from_name(claims.name) or self._generate_default_username()
-            user = User(
-                id=str(uuid.uuid4()),
-                username=username,
-                email=claims.email,
-                password_hash=None,
-                auth_provider="google",
-                is_verified=True,
-                verified_at=now,
-                email_verification_token_hash=None,
-                email_verification_expires_at=None,
-                password_reset_token_hash=None,
-                password_reset_expires_at=None,
-                password_reset_requested_at=None,
+            username = (
+                await self._derive_username_from_name(claims.name)
+                or await self._generate_default_username()
             )
-            self._db.add(user)
-            self._db.commit()
-            self._db.refresh(user)
+            # RETURNING hands back server defaults (created_at/updated_at): no refresh SELECT.
+            user = (
+                await self._db.execute(
+                    insert(User)
+                    .values(
+                        id=_new_user_id(),
+                        username=username,
+                        email=claims.email,
+                        email_hash=email_hash,
+                        password_hash=None,
+                        auth_provider="google",
+                        is_verified=True,
+                        verified_at=now,
+                        email_verification_token_hash=None,
+                        email_verification_expires_at=None,
+                        password_reset_token_hash=None,
+                        password_reset_expires_at=None,
+                        password_reset_requested_at=None,
+                    )
+                    .returning(User)
+                )
+            ).scalar_one()
+            await self._db.commit()
             return user
 
         # Link existing account to Google (Option A).
@@ -138,40 +328,38 @@ class AuthService:
 
         # Ensure username exists.
         if not user.username:
-            user.username = self._derive_username_from_name(claims.name) or self._generate_default_username()
+            user.username = (
+                await self._derive_username_from_name(claims.name)
+                or await self._generate_default_username()
+            )
 
         self._db.add(user)
-        self._db.commit()
-        self._db.refresh(user)
+        await self._db.commit()
         return user
 
-    def _derive_username_from_name(self, name: str | None) -> str | None:
+    async def _derive_username_from_name(self, name: str | None) -> str | None:
         if not name:
             return None
 
         # Convert to allowed charset: letters/numbers/underscore; collapse runs.
-        cleaned = re.sub(r"[^A-Za-z0-9]+", "_", name.strip())
-        cleaned = cleaned.strip("_")
+        cleaned = _NON_USERNAME_CHARS.sub("_", name.strip()).strip("_")
         if not cleaned:
             return None
 
         candidate = cleaned[:30]
-        if _USERNAME_RE.fullmatch(candidate) is None:
+        if not _is_valid_username(candidate):
             return None
 
-        existing = self._db.scalar(select(User).where(User.username == candidate))
-        if existing is None:
-            return candidate
+        candidates = [candidate]
 
-        # If taken, append a short suffix while keeping constraints.
+        # Fallback if taken: append a short suffix while keeping constraints.
         suffix = secrets.token_hex(2)
         base = candidate[: max(0, 30 - (1 + len(suffix)))]
         candidate2 = f"{base}_{suffix}" if base else f"user_{suffix}"
-        if _USERNAME_RE.fullmatch(candidate2) is None:
-            return None
+        if _is_valid_username(candidate2):
+            candidates.append(candidate2)
 
-        existing2 = self._db.scalar(select(User).where(User.username == candidate2))
-        return candidate2 if existing2 is None else None
+        return await self._first_available_username(candidates)
 
     def issue_access_token(self, *, user: User) -> str:
         return create_access_token(
@@ -183,110 +371,62 @@ class AuthService:
             },
         )
 
-    def get_auth_provider_for_email(self, *, email: str) -> str | None:
-        user = self._db.scalar(select(User).where(User.email == email))
+    async def get_auth_provider_for_email(self, *, email: str) -> str | None:
+        user = await self._db.scalar(_SEL_USER_BY_EMAIL, {"email_hash": hash_email(email)})
         return user.auth_provider if user is not None else None
 
-    def verify_email(self, *, token: str) -> None:
-        token_hash = hash_email_verification_token(token)
-        user = self._db.scalar(select(User).where(User.email_verification_token_hash == token_hash))
-        if user is None:
-            raise ValueError("Invalid or expired token")
-
-        if user.is_verified:
-            # Token should be single-use; treat as invalid once verified.
+    async def verify_email(self, *, token: str, now: datetime) -> None:
+        params = {
+            "token_hash": hash_email_verification_token(token),
+            "now": now,
+        }
+        async with self._db.begin():
+            user_id = await self._db.scalar(_UPD_VERIFY_EMAIL, params)
+        if user_id is None:
             raise ValueError("Invalid or expired token")
 
-        expires_at = user.email_verification_expires_at
-        if expires_at is None:
-            raise ValueError("Invalid or expired token")
-
-        # SQLite may return naive datetimes even when timezone=True; interpret as UTC.
-        if expires_at.tzinfo is None:
-            expires_at = expires_at.replace(tzinfo=timezone.utc)
-
-        now = datetime.now(timezone.utc)
-        if expires_at < now:
-            raise ValueError("Invalid or expired token")
-
-        user.is_verified = True
-        user.verified_at = now
-        user.email_verification_token_hash = None
-        user.email_verification_expires_at = None
-        self._db.add(user)
-        self._db.commit()
-
-
-    def request_password_reset(self, *, email: str) -> str | None:
+    async def request_password_reset(self, *, email: str, now: datetime) -> str | None:
         """Creates a password reset token for password accounts.
 
         Returns the raw token (to be emailed) or None.
         Caller must always return a neutral response to avoid account enumeration.
         """
 
-        user = self._db.scalar(select(User).where(User.email == email))
-        if user is None:
-            return None
-
-        # OAuth accounts cannot reset via password.
-        if user.auth_provider != "password" or not user.password_hash:
-            return None
-
-        now = datetime.now(timezone.utc)
-        if user.password_reset_requested_at is not None:
-            requested_at = user.password_reset_requested_at
-            if requested_at.tzinfo is None:
-                requested_at = requested_at.replace(tzinfo=timezone.utc)
-
-            cooldown = timedelta(seconds=settings.password_reset_request_cooldown_seconds)
-            if now - requested_at < cooldown:
-                return None
-
+        cooldown = timedelta(seconds=settings.password_reset_request_cooldown_seconds)
         raw_token = generate_password_reset_token()
-        user.password_reset_token_hash = hash_password_reset_token(raw_token)
-        user.password_reset_expires_at = now + timedelta(minutes=settings.password_reset_token_minutes)
-        user.password_reset_requested_at = now
-
-        self._db.add(user)
-        self._db.commit()
-        return raw_token
-
-
-    def reset_password(self, *, token: str, new_password: str) -> None:
+        params = {
+            "b_email_hash": hash_email(email),
+            "cooldown_until": now - cooldown,
+            "token_hash": hash_password_reset_token(raw_token),
+            "expires_at": now + timedelta(minutes=settings.password_reset_token_minutes),
+            "now": now,
+        }
+        async with self._db.begin():
+            user_id = await self._db.scalar(_UPD_ISSUE_PASSWORD_RESET, params)
+        # No row: unknown email, OAuth account or still in cooldown.
+        return raw_token if user_id is not None else None
+
+    async def reset_password(self, *, token: str, new_password: str, now: datetime) -> None:
         validate_password_strength(new_password)
         token_hash = hash_password_reset_token(token)
-        user = self._db.scalar(select(User).where(User.password_reset_token_hash == token_hash))
-        if user is None:
-            raise ValueError("Invalid or expired token")
-
-        expires_at = user.password_reset_expires_at
-        if expires_at is None:
-            raise ValueError("Invalid or expired token")
-
-        if expires_at.tzinfo is None:
-            expires_at = expires_at.replace(tzinfo=timezone.utc)
-
-        now = datetime.now(timezone.utc)
-        if expires_at < now:
+        # Reject invalid/expired tokens before spending a hash on them; this flow has no
+        # per-account throttle, so the hash pool must only see plausible requests.
+        async with self._db.begin():
+            pending = await self._db.scalar(
+                _SEL_PENDING_PASSWORD_RESET, {"token_hash": token_hash, "now": now}
+            )
+        if pending is None:
             raise ValueError("Invalid or expired token")
 
-        # Token should only exist for password accounts.
-        if user.auth_provider != "password":
+        # Hash between the two short transactions so no connection is held during the hash.
+        password_hash = await run_in_hash_pool(hash_password, new_password)
+        params = {
+            "token_hash": token_hash,
+            "now": now,
+            "b_password_hash": password_hash,
+        }
+        async with self._db.begin():
+            # Same conditions again: the UPDATE still decides races between concurrent resets.
+            user_id = await self._db.scalar(_UPD_RESET_PASSWORD, params)
+        if user_id is None:
             raise ValueError("Invalid or expired token")
-
-        user.password_hash = hash_password(new_password)
-
-        # Invalidate token immediately (single-use).
-        user.password_reset_token_hash = None
-        user.password_reset_expires_at = None
-        user.password_reset_requested_at = None
-
-        # Reset implicitly verifies email.
-        if not user.is_verified:
-            user.is_verified = True
-            user.verified_at = now
-            user.email_verification_token_hash = None
-            user.email_verification_expires_at = None
-
-        self._db.add(user)
-        self._db.commit()
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+import sys
 
 
 @dataclass(frozen=True)
@@ -28,18 +29,33 @@ class EmailService:
         raise NotImplementedError
 
 
+def _write_console_email(*, title: str, to_email: str, subject: str, link: str) -> None:
+    # One pre-formatted write (one stdout lock/encode) instead of a print() per line;
+    # flushed right away so the link shows up even when stdout is block-buffered.
+    sys.stdout.write(
+        f"\n--- MyFuture AI: {title} ---\n"
+        f"To: {to_email}\n"
+        f"Subject: {subject}\n"
+        f"Link: {link}\n"
+        "--- end ---\n\n"
+    )
+    sys.stdout.flush()
+
+
 class ConsoleEmailService(EmailService):
     def send_verification_email(self, email: VerificationEmail) -> None:
         # Minimal, provider-free implementation suitable for local development.
-        print("\n--- MyFuture AI: Verification Email ---")
-        print(f"To: {email.to_email}")
-        print("Subject: Verify your email")
-        print(f"Link: {email.verify_link}")
-        print("--- end ---\n")
+        _write_console_email(
+            title="Verification Email",
+            to_email=email.to_email,
+            subject="Verify your email",
+            link=email.verify_link,
+        )
 
     def send_password_reset_email(self, email: PasswordResetEmail) -> None:
-        print("\n--- MyFuture AI: Password Reset Email ---")
-        print(f"To: {email.to_email}")
-        print("Subject: Reset your password")
-        print(f"Link: {email.reset_link}")
-        print("--- end ---\n")
+        _write_console_email(
+            title="Password Reset Email",
+            to_email=email.to_email,
+            subject="Reset your password",
+            link=email.reset_link,
+        )
@@ -1,6 +1,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+import hashlib
+import threading
+import time
+
+from cachetools import TLRUCache
 
 from app.core.config import settings
 
@@ -13,6 +18,43 @@ class GoogleTokenClaims:
     email_verified: bool | None
 
 
+# Verified tokens: sha256(id_token) -> (claims, exp). ID tokens get re-sent within their
+# lifetime (SPA refreshes, repeat logins); serve those without re-verifying the signature.
+# Keyed by digest so raw tokens are never held in memory. Each entry lives until the
+# token's own exp (capped at an hour) and is evicted with it. Called from worker threads,
+# hence the lock.
+_VERIFIED_CACHE_MAX_TTL_SECONDS = 3600.0
+_verified_cache: TLRUCache[bytes, tuple[GoogleTokenClaims, float]] = TLRUCache(
+    maxsize=10_000,
+    ttu=lambda _key, value, now: min(value[1], now + _VERIFIED_CACHE_MAX_TTL_SECONDS),
+    timer=time.time,
+)
+_verified_cache_lock = threading.Lock()
+
+
+# google-auth is an optional runtime dependency: resolve it once at import; Google login
+# reports "not available" when it is missing. One pooled HTTP session serves the certs
+# fetch instead of a new TLS handshake per login.
+try:
+    import requests
+    from google.auth.transport import requests as _google_requests
+    from google.oauth2 import id_token as _google_id_token
+except ImportError:  # pragma: no cover
+    _GREQ = None
+else:
+    _session = requests.Session()
+    # Verification runs on the anyio worker threads (40 by default); size the keep-alive
+    # pool so concurrent logins reuse connections instead of opening throwaway ones.
+    _session.mount("https://", requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=64))
+    _GREQ = _google_requests.Request(session=_session)
+
+
+def close_google_transport() -> None:
+    # Release pooled connections on shutdown.
+    if _GREQ is not None:
+        _GREQ.session.close()
+
+
 def verify_google_id_token(id_token: str) -> GoogleTokenClaims:
     """Verify a Google ID token and return validated claims.
 
@@ -26,15 +68,17 @@ def verify_google_id_token(id_token: str) -> GoogleTokenClaims:
     if not client_id:
         raise ValueError("Google login is not configured")
 
-    try:
-        from google.auth.transport import requests as google_requests
-        from google.oauth2 import id_token as google_id_token
-    except Exception as exc:  # pragma: no cover
-        raise ValueError("Google token verification is not available") from exc
+    cache_key = hashlib.sha256(id_token.encode("utf-8")).digest()
+    with _verified_cache_lock:
+        hit = _verified_cache.get(cache_key)
+    if hit is not None:
+        return hit[0]
+
+    if _GREQ is None:  # pragma: no cover
+        raise ValueError("Google token verification is not available")
 
     try:
-        request = google_requests.Request()
-        info = google_id_token.verify_oauth2_token(id_token, request, audience=client_id)
+        info = _google_id_token.verify_oauth2_token(id_token, _GREQ, audience=client_id)
     except Exception as exc:
         raise ValueError("Invalid Google token") from exc
 
@@ -56,9 +100,16 @@ def verify_google_id_token(id_token: str) -> GoogleTokenClaims:
     else:
         email_verified = None
 
-    return GoogleTokenClaims(
+    claims = GoogleTokenClaims(
         email=str(email).lower(),
         sub=str(sub),
         name=str(name) if isinstance(name, str) and name.strip() else None,
         email_verified=email_verified,
     )
+
+    exp = info.get("exp")
+    if isinstance(exp, (int, float)):
+        with _verified_cache_lock:
+            _verified_cache[cache_key] = (claims, float(exp))
+
+    return claims
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator
+from pathlib import Path
+import tempfile
+
+import pytest
+
+# Settings are read at import time: point the app at a throwaway database before any
+# app module is imported.
+_DB_DIR = tempfile.mkdtemp(prefix="myfuture-tests-")
+os.environ["MYFUTURE_DATABASE_URL"] = f"sqlite:///{Path(_DB_DIR) / 'test.db'}"
+
+from alembic import command  # noqa: E402
+from alembic.config import Config  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+_BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+
+@pytest.fixture(scope="session")
+def client() -> Iterator[TestClient]:
+    config = Config(str(_BACKEND_DIR / "alembic.ini"))
+    config.set_main_option("script_location", str(_BACKEND_DIR / "alembic"))
+    command.upgrade(config, "head")
+
+    from app.main import app
+
+    with TestClient(app) as test_client:
+        yield test_client
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import re
+
+import pytest
+from fastapi.testclient import TestClient
+
+_PASSWORD = "Passw0rd!"
+_NEW_PASSWORD = "N3wPassw0rd!"
+
+
+def _last_link_token(output: str, path: str) -> str:
+    tokens = re.findall(rf"/{path}\?token=(\S+)", output)
+    assert tokens, f"no {path} link was emailed"
+    return tokens[-1]
+
+
+def test_forgot_then_reset_password(client: TestClient, capsys: pytest.CaptureFixture[str]) -> None:
+    email = "Reset.Flow@Example.com"
+    resp = client.post("/api/auth/register", json={"email": email, "password": _PASSWORD})
+    assert resp.status_code == 200, resp.text
+
+    verify_token = _last_link_token(capsys.readouterr().out, "verify-email")
+    resp = client.get("/api/auth/verify-email", params={"token": verify_token})
+    assert resp.status_code == 200, resp.text
+
+    resp = client.post("/api/auth/forgot-password", json={"email": email})
+    assert resp.status_code == 200, resp.text
+    reset_token = _last_link_token(capsys.readouterr().out, "reset-password")
+
+    # Cooldown: an immediate second request is neutral and issues no new token.
+    resp = client.post("/api/auth/forgot-password", json={"email": email})
+    assert resp.status_code == 200, resp.text
+    assert "reset-password?token=" not in capsys.readouterr().out
+
+    resp = client.post(
+        "/api/auth/reset-password",
+        json={"token": reset_token, "new_password": _NEW_PASSWORD},
+    )
+    assert resp.status_code == 200, resp.text
+
+    # Single-use token.
+    resp = client.post(
+        "/api/auth/reset-password",
+        json={"token": reset_token, "new_password": _NEW_PASSWORD},
+    )
+    assert resp.status_code == 400
+
+    resp = client.post("/api/auth/login", json={"email": email, "password": _PASSWORD})
+    assert resp.status_code == 401
+    resp = client.post("/api/auth/login", json={"email": email, "password": _NEW_PASSWORD})
+    assert resp.status_code == 200, resp.text
+
+
+def test_reset_password_rejects_unknown_token(client: TestClient) -> None:
+    resp = client.post(
+        "/api/auth/reset-password",
+        json={"token": "not-a-real-token", "new_password": _NEW_PASSWORD},
+    )
+    assert resp.status_code == 400
+
+
+def test_forgot_password_unknown_email_is_neutral(client: TestClient) -> None:
+    resp = client.post("/api/auth/forgot-password", json={"email": "nobody@example.com"})
+    assert resp.status_code == 200, resp.text
+
+
+def test_reset_password_checks_token_before_hashing(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from app.services import auth_service
+
+    async def _fail(*args: object) -> None:
+        raise AssertionError("hash pool used for an invalid token")
+
+    monkeypatch.setattr(auth_service, "run_in_hash_pool", _fail)
+    resp = client.post(
+        "/api/auth/reset-password",
+        json={"token": "junk-token-value", "new_password": _NEW_PASSWORD},
+    )
+    assert resp.status_code == 400
+
+
+def test_register_rejects_duplicate_email_and_username(client: TestClient) -> None:
+    body = {"email": "dup@example.com", "password": _PASSWORD, "username": "dup_user"}
+    assert client.post("/api/auth/register", json=body).status_code == 200
+
+    resp = client.post("/api/auth/register", json={**body, "username": "other_user"})
+    assert resp.status_code == 400
+    assert resp.json()["detail"] == "Email already registered"
+
+    resp = client.post("/api/auth/register", json={**body, "email": "dup2@example.com"})
+    assert resp.status_code == 400
+    assert resp.json()["detail"] == "Username already taken"
+
+
+def test_throttled_login_never_hashes(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from app.services import auth_service
+
+    email = "throttled@example.com"
+    for _ in range(auth_service.settings.login_rate_limit_attempts):
+        resp = client.post("/api/auth/login", json={"email": email, "password": _PASSWORD})
+        assert resp.status_code == 401
+
+    async def _fail(*args: object) -> None:
+        raise AssertionError("hash pool used for a throttled login")
+
+    monkeypatch.setattr(auth_service, "run_in_hash_pool", _fail)
+    resp = client.post("/api/auth/login", json={"email": email, "password": _PASSWORD})
+    assert resp.status_code == 401
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import asyncio
+
+from app.core import security
+
+
+def _kill_hash_workers() -> None:
+    for process in list(security._hash_executor()._processes.values()):
+        process.kill()
+        process.join()
+
+
+async def _hash_after_workers_die() -> tuple[bool, bool]:
+    await security.start_hash_pool()
+    _kill_hash_workers()
+    password_hash = await security.run_in_hash_pool(security.hash_password, "Passw0rd!")
+    # The replacement pool keeps serving later calls too.
+    verified = await security.run_in_hash_pool(security.verify_password, "Passw0rd!", password_hash)
+    return bool(password_hash), verified
+
+
+def test_run_in_hash_pool_recovers_from_dead_workers() -> None:
+    broken = security._hash_executor()
+    try:
+        assert asyncio.run(_hash_after_workers_die()) == (True, True)
+        assert security._hash_executor() is not broken
+    finally:
+        security.shutdown_hash_pool()
+
+
+def test_start_hash_pool_spawns_every_worker() -> None:
+    try:
+        asyncio.run(security.start_hash_pool())
+        assert len(security._hash_executor()._processes) == security.settings.hash_concurrency
+    finally:
+        security.shutdown_hash_pool()
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from fastapi.testclient import TestClient
+
+from app.api.protected import orientations, results
+from app.db.session import get_engine
+from app.dependencies import auth
+
+
+async def _execute_hot_statements() -> None:
+    async with get_engine().connect() as conn:
+        for stmt in (
+            orientations._list_orientations_stmt,
+            results._list_results_stmt,
+            auth._user_by_id_stmt,
+        ):
+            await conn.execute(stmt, {"uid": ""})
+
+
+def test_lifespan_warms_compiled_cache(client: TestClient) -> None:
+    cache = get_engine().sync_engine._compiled_cache
+    before = len(cache)
+    assert client.portal is not None
+    client.portal.call(_execute_hot_statements)
+    # Already compiled at startup: executing them again adds no cache entries.
+    assert len(cache) == before >= 3